@@ -3,6 +3,7 @@ import re
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(ROOT))
@@ -22,6 +23,37 @@ logger.info(f"YouGame Explorer starting — {len(players_cfg.get('monitored_play
 STREAMER_NAMES = [p["name"] for p in players_cfg.get("monitored_players", [])]
 ALL_STREAMERS = STREAMER_NAMES + ["Faker", "Uzi", "大司马", "TheShy", "Rookie", "PDD", "小团团",
                                    "Doublelift", "Shroud", "Ninja"]
+GAME_NAMES = ("英雄联盟", "LOL", "王者荣耀", "Valorant", "绝地求生", "原神", "Fortnite", "CS2", "Dota2")
+
+
+def _names_pattern(names) -> re.Pattern:
+    """Case-insensitive pattern matching, at every offset, the longest name starting there."""
+    alts = sorted({re.escape(n) for n in names}, key=len, reverse=True)
+    return re.compile(f"(?=({'|'.join(alts)}))", re.I)
+
+
+def _names_rank(names) -> dict[str, tuple[int, str]]:
+    """Map each casefolded name to the earliest-listed name it contains, as (index, spelling).
+
+    A match only reports the longest name at its offset, so shorter names inside it
+    are folded in here to keep table-order priority.
+    """
+    first: dict[str, tuple[int, str]] = {}
+    for i, n in enumerate(names):
+        first.setdefault(n.casefold(), (i, n))
+    return {k: min(v for j, v in first.items() if j in k) for k in first}
+
+
+def _first_listed(pattern: re.Pattern, rank: dict, text: str) -> Optional[str]:
+    """Return the name found in text that comes first in its table, or None."""
+    hits = [rank[k] for m in pattern.finditer(text) if (k := m.group(1).casefold()) in rank]
+    return min(hits)[1] if hits else None
+
+
+STREAMER_PATTERN = _names_pattern(ALL_STREAMERS)
+GAME_PATTERN = _names_pattern(GAME_NAMES)
+_STREAMER_RANK = _names_rank(ALL_STREAMERS)
+_GAME_RANK = _names_rank(GAME_NAMES)
 
 LIVE_KEYWORDS = re.compile(r"直播|开播|在播|在线|live|streaming", re.I)
 BRIEF_KEYWORDS = re.compile(r"简报|日报|汇总|总结|报告|动态|briefing", re.I)
@@ -34,16 +66,14 @@ def detect_intent(text: str) -> tuple[str, dict]:
     entities: dict = {}
 
     # Extract streamer name
-    for name in ALL_STREAMERS:
-        if name.lower() in text.lower():
-            entities["streamer"] = name
-            break
+    streamer = _first_listed(STREAMER_PATTERN, _STREAMER_RANK, text)
+    if streamer:
+        entities["streamer"] = streamer
 
     # Extract game
-    for game in ["英雄联盟", "LOL", "王者荣耀", "Valorant", "绝地求生", "原神", "Fortnite", "CS2", "Dota2"]:
-        if game.lower() in text.lower():
-            entities["game"] = game
-            break
+    game = _first_listed(GAME_PATTERN, _GAME_RANK, text)
+    if game:
+        entities["game"] = game
 
     if LIVE_KEYWORDS.search(text):
         return "live_query", entities
@@ -130,21 +160,25 @@ def handle_hello() -> str:
             "直接输入你的问题即可！")
 
 
+INTENT_HANDLERS = {
+    "live_query": handle_live_query,
+    "briefing": lambda _: handle_briefing(),
+    "trending": lambda _: handle_trending(),
+    "hello": lambda _: handle_hello(),
+}
+
+
 def handle_query(user_input: str) -> str:
     """Main entry: detect intent → build response."""
-    if not user_input.strip():
+    text = user_input.strip()
+    if not text:
         return ""
-    intent, entities = detect_intent(user_input)
-    logger.info(f"Query: {user_input!r} → intent={intent}, entities={entities}")
+    intent, entities = detect_intent(text)
+    logger.info("Query: {!r} → intent={}, entities={}", text, intent, entities)
 
-    if intent == "live_query":
-        return handle_live_query(entities)
-    if intent == "briefing":
-        return handle_briefing()
-    if intent == "trending":
-        return handle_trending()
-    if intent == "hello":
-        return handle_hello()
+    handler = INTENT_HANDLERS.get(intent)
+    if handler:
+        return handler(entities)
 
     # Unknown — if we found a streamer name, treat as live query
     if entities.get("streamer"):
@@ -4,6 +4,11 @@ from pathlib import Path
 from dotenv import load_dotenv
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 ROOT = Path(__file__).parent.parent
 
 def load_env():
@@ -17,7 +22,7 @@ def load_players(path: str = "config/players.yaml") -> dict:
     cfg_path = ROOT / path
     if cfg_path.exists():
         with open(cfg_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=SafeLoader) or {}
     return {}
 
 def get_port() -> int:
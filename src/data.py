@@ -23,26 +23,50 @@ TITLES = {
     "Valorant": ["冲击不朽段位", "新特工体验", "枪法练习"],
     "Fortnite": ["大逃杀冲分", "新赛季体验", "建造练习"],
 }
+DEFAULT_TITLES = ["精彩直播中"]
 
 
-def _make_stream(s: dict) -> dict:
+def _stream_base(s: dict) -> dict:
+    """Fields of a streamer's live-stream dict that don't change between calls."""
+    return {
+        "user_name": s["name"],
+        "user_login": s["login"],
+        "platform": s["platform"],
+        "game_name": s["game"],
+        "live_url": f"https://{s['platform'].lower()}.com/{s['login']}",
+        "is_live": True,
+    }
+
+
+STREAM_BASE = {s["login"]: _stream_base(s) for s in STREAMERS}
+
+
+def _streamer_index() -> dict[str, dict]:
+    """Map lowercased names and logins to streamers; the first in STREAMERS wins a clash."""
+    index: dict[str, dict] = {}
+    for s in STREAMERS:
+        for k in (s["name"], s["login"]):
+            index.setdefault(k.lower(), s)
+    return index
+
+
+STREAMER_INDEX = _streamer_index()
+
+
+def _make_stream(s: dict, now: Optional[datetime] = None) -> dict:
     """Build a mock live-stream dict for one streamer."""
+    now = now or datetime.now()
     base = random.randint(1000, 50000)
     factor = min(s["followers"] / 1_000_000, 10)
-    hour = datetime.now().hour
+    hour = now.hour
     tf = 1.5 if 19 <= hour <= 23 else (1.2 if 14 <= hour <= 18 else 0.8)
     viewers = max(int(base * factor * tf * random.uniform(0.7, 1.3)), 100)
-    titles = TITLES.get(s["game"], ["精彩直播中"])
+    titles = TITLES.get(s["game"], DEFAULT_TITLES)
     return {
-        "user_name": s["name"],
-        "user_login": s["login"],
-        "platform": s["platform"],
-        "game_name": s["game"],
+        **STREAM_BASE[s["login"]],
         "viewer_count": viewers,
         "title": random.choice(titles),
-        "live_url": f"https://{s['platform'].lower()}.com/{s['login']}",
-        "is_live": True,
-        "started_at": (datetime.now() - timedelta(hours=random.randint(1, 8))).isoformat(),
+        "started_at": (now - timedelta(hours=random.randint(1, 8))).isoformat(),
     }
 
 
@@ -50,20 +74,25 @@ def get_live_streams(game: Optional[str] = None, streamer: Optional[str] = None,
     """Return mock live streams, optionally filtered by game or streamer name."""
     pool = STREAMERS
     if streamer:
-        pool = [s for s in pool if streamer.lower() in s["name"].lower() or streamer.lower() in s["login"].lower()]
+        streamer = streamer.lower()
+        pool = [s for s in pool if streamer in s["name"].lower() or streamer in s["login"].lower()]
     if game:
-        pool = [s for s in pool if game.lower() in s["game"].lower()]
+        game = game.lower()
+        pool = [s for s in pool if game in s["game"].lower()]
     if not pool:
         return []
     # ~70% chance each streamer is live
-    live = [_make_stream(s) for s in pool if random.random() < 0.7]
+    now = datetime.now()
+    live = [_make_stream(s, now) for s in pool if random.random() < 0.7]
     live.sort(key=lambda x: x["viewer_count"], reverse=True)
     return live[:limit]
 
 
 def get_streamer_status(name: str) -> Optional[dict]:
     """Check if a specific streamer is live. Returns dict or None."""
-    match = next((s for s in STREAMERS if name.lower() in s["name"].lower() or name.lower() in s["login"].lower()), None)
+    key = name.lower()
+    match = STREAMER_INDEX.get(key) or next(
+        (s for s in STREAMERS if key in s["name"].lower() or key in s["login"].lower()), None)
     if not match:
         return None
     if random.random() < 0.7: